@@ -0,0 +1,83 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled keyword sweep for reddit_persona_analyzer.py.
+Build in place with: cythonize -i _persona_fast.pyx
+"""
+
+from array import array
+from collections import deque
+
+cdef class KeywordSweeper:
+    """Aho-Corasick automaton over the UTF-8 bytes of a fixed keyword list"""
+
+    cdef int[::1] _goto
+    cdef unsigned char[::1] _terminal
+    cdef list _outputs
+    cdef Py_ssize_t _n_states
+
+    def __init__(self, keywords):
+        # Build the keyword trie, one edge per UTF-8 byte
+        edges = [{}]
+        outputs = [[]]
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for byte in keyword.encode('utf-8'):
+                next_state = edges[state].get(byte)
+                if next_state is None:
+                    next_state = len(edges)
+                    edges[state][byte] = next_state
+                    edges.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Resolve failure links breadth-first into a full 256-way transition table,
+        # so the scan loop is a single table lookup per byte
+        n_states = len(edges)
+        goto = array('i', [0]) * (n_states * 256)
+        fail = [0] * n_states
+        queue = deque()
+        for byte in range(256):
+            next_state = edges[0].get(byte, 0)
+            goto[byte] = next_state
+            if next_state:
+                queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            for byte in range(256):
+                next_state = edges[state].get(byte)
+                if next_state is None:
+                    goto[state * 256 + byte] = goto[fail[state] * 256 + byte]
+                else:
+                    goto[state * 256 + byte] = next_state
+                    fail[next_state] = goto[fail[state] * 256 + byte]
+                    queue.append(next_state)
+
+        self._goto = goto
+        self._terminal = bytearray(1 if matches else 0 for matches in outputs)
+        self._outputs = outputs
+        self._n_states = n_states
+
+    def sweep(self, bytes corpus):
+        """Return the indices of every keyword that occurs in the UTF-8 corpus"""
+        cdef Py_ssize_t size = len(corpus)
+        cdef Py_ssize_t i, state
+        cdef const unsigned char* data = corpus
+        cdef int[::1] goto = self._goto
+        cdef unsigned char[::1] terminal = self._terminal
+        cdef unsigned char[::1] seen = bytearray(self._n_states)
+        cdef int current = 0
+
+        with nogil:
+            for i in range(size):
+                current = goto[current * 256 + data[i]]
+                if terminal[current]:
+                    seen[current] = 1
+
+        hits = set()
+        for state in range(self._n_states):
+            if seen[state]:
+                hits.update(self._outputs[state])
+        return hits
@@ -5,17 +5,76 @@ This script scrapes a Reddit user's profile and generates a detailed user person
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import heapq
 import re
 import os
 import sys
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
 import argparse
+from array import array
 
-@dataclass
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import _persona_fast
+except ImportError:
+    _persona_fast = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+# Where --cache keeps downloaded listings between runs, and for how long
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'reddit-persona')
+CACHE_EXPIRE_SECONDS = 3600
+
+# Upper bound on users scraped at once, to stay within Reddit's rate limits
+MAX_CONCURRENT_USERS = 8
+
+# Username segment of a /user/<name> or /u/<name> profile URL
+_USER_RE = re.compile(r'/(?:user|u)/([^/?#]+)')
+
+# simdjson parsers are not thread-safe, so keep one per fetch thread
+_json_local = threading.local()
+
+def _decode_json(payload: bytes):
+    """Decode a JSON response body, preferring simdjson, then orjson, then json"""
+    if simdjson is None:
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
+    
+    parser = getattr(_json_local, 'parser', None)
+    if parser is None:
+        parser = _json_local.parser = simdjson.Parser()
+    return parser.parse(payload)
+
+@dataclass(slots=True, frozen=True)
 class RedditPost:
     """Data class for Reddit posts"""
     title: str
@@ -26,56 +85,123 @@ class RedditPost:
     url: str
     post_type: str
 
+@dataclass
+class PostBatch:
+    """Scraped posts stored column by column for the analyzer's sweeps"""
+    titles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    subreddits: List[str] = field(default_factory=list)
+    scores: array = field(default_factory=lambda: array('q'))
+    created_utcs: array = field(default_factory=lambda: array('d'))
+    urls: List[str] = field(default_factory=list)
+    post_types: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.post_types)
+    
+    def extend(self, posts: Iterable[RedditPost]):
+        """Append each post's fields to the matching columns"""
+        for post in posts:
+            self.titles.append(post.title)
+            self.contents.append(post.content)
+            self.subreddits.append(post.subreddit)
+            self.scores.append(post.score)
+            self.created_utcs.append(post.created_utc)
+            self.urls.append(post.url)
+            self.post_types.append(post.post_type)
+
+@dataclass
+class Aggregates:
+    """Per-user statistics computed once and shared by the persona extractors"""
+    post_count: int
+    total_posts: int
+    total_comments: int
+    score_sum: int
+    subreddit_counts: Counter
+    top_subreddits: List[tuple]
+    top_post_urls: List[str]
+    corpus: bytes
+
 class RedditScraper:
     """Reddit scraper using Reddit's JSON API"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, use_cache: bool = False):
+        if use_cache:
+            if CachedSession is None:
+                raise ImportError("Caching requires requests-cache (pip install requests-cache)")
+            
+            # Re-runs for the same user are served from disk instead of the network
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            self.session = CachedSession(
+                os.path.join(CACHE_DIR, 'http_cache'),
+                backend='sqlite',
+                expire_after=CACHE_EXPIRE_SECONDS
+            )
+        else:
+            self.session = requests.Session()
+        
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
+        # Keep connections alive between requests and retry rate limits / server errors
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        # Each user in flight holds up to two connections (posts and comments)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=2 * MAX_CONCURRENT_USERS,
+            max_retries=retries
+        ))
+        
     def extract_username(self, profile_url: str) -> str:
         """Extract username from Reddit profile URL"""
-        # Handle different URL formats
-        if '/user/' in profile_url:
-            username = profile_url.split('/user/')[1].rstrip('/')
-        elif '/u/' in profile_url:
-            username = profile_url.split('/u/')[1].rstrip('/')
-        else:
+        # Handles both /user/ and /u/ formats, ignoring any trailing path, query or fragment
+        match = _USER_RE.search(profile_url)
+        if not match:
             raise ValueError(f"Invalid Reddit profile URL: {profile_url}")
         
-        return username
+        return match.group(1)
     
-    def scrape_user_content(self, username: str, limit: int = 50) -> List[RedditPost]:
+    def scrape_user_content(self, username: str, limit: int = 50) -> PostBatch:
         """Scrape user's posts and comments"""
-        posts = []
+        posts = PostBatch()
         
         print(f"Scraping data for user: {username}")
         
-        # Get user's submitted posts
-        print("Fetching user posts...")
-        posts.extend(self._get_user_posts(username, limit // 2))
-        
-        # Get user's comments
-        print("Fetching user comments...")
-        posts.extend(self._get_user_comments(username, limit // 2))
+        # Posts and comments are independent endpoints, so fetch them concurrently
+        print("Fetching user posts and comments...")
+        # Each worker drains its own generator, so both requests are in flight at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            posts_future = executor.submit(list, self._get_user_posts(username, limit // 2))
+            comments_future = executor.submit(list, self._get_user_comments(username, limit // 2))
+            
+            posts.extend(chain(posts_future.result(), comments_future.result()))
         
         return posts
     
-    def _get_user_posts(self, username: str, limit: int) -> List[RedditPost]:
+    def scrape_many_users(self, usernames: List[str], limit: int = 50) -> List[PostBatch]:
+        """Scrape several users concurrently, returning their posts in the same order"""
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_USERS) as executor:
+            return list(executor.map(lambda username: self.scrape_user_content(username, limit), usernames))
+    
+    def _get_user_posts(self, username: str, limit: int) -> Iterator[RedditPost]:
         """Get user's submitted posts"""
         url = f"https://www.reddit.com/user/{username}/submitted.json"
         return self._fetch_content(url, limit, 'post')
     
-    def _get_user_comments(self, username: str, limit: int) -> List[RedditPost]:
+    def _get_user_comments(self, username: str, limit: int) -> Iterator[RedditPost]:
         """Get user's comments"""
         url = f"https://www.reddit.com/user/{username}/comments.json"
         return self._fetch_content(url, limit, 'comment')
     
-    def _fetch_content(self, url: str, limit: int, content_type: str) -> List[RedditPost]:
-        """Fetch content from Reddit API"""
-        posts = []
+    def _fetch_content(self, url: str, limit: int, content_type: str) -> Iterator[RedditPost]:
+        """Fetch content from Reddit API, yielding posts as they are parsed"""
+        scraped = 0
         params = {'limit': min(limit, 25)}
         
         try:
@@ -83,157 +209,245 @@ class RedditScraper:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _decode_json(response.content)
             
-            if 'data' not in data or 'children' not in data['data']:
+            listing = data.get('data')
+            if listing is None or 'children' not in listing:
                 print(f"No data found for {content_type}s")
-                return posts
+                return
             
-            children = data['data']['children']
+            children = listing['children']
             print(f"Found {len(children)} {content_type}s")
             
             for child in children:
-                if len(posts) >= limit:
+                if scraped >= limit:
                     break
                     
                 item_data = child['data']
                 
+                # Read the text fields first so skipped items never decode the rest
                 if content_type == 'post':
+                    title = item_data.get('title', '')
+                    
                     # Skip deleted or removed posts
-                    if item_data.get('removed_by_category') or item_data.get('title') == '[deleted]':
+                    if item_data.get('removed_by_category') or title == '[deleted]':
                         continue
-                        
-                    post = RedditPost(
-                        title=item_data.get('title', ''),
-                        content=item_data.get('selftext', ''),
-                        subreddit=item_data.get('subreddit', ''),
-                        score=item_data.get('score', 0),
-                        created_utc=item_data.get('created_utc', 0),
-                        url=f"https://reddit.com{item_data.get('permalink', '')}",
-                        post_type='post'
-                    )
+                    
+                    content = item_data.get('selftext', '')
                 else:  # comment
+                    title = ''
+                    content = item_data.get('body', '')
+                    
                     # Skip deleted or removed comments
-                    if item_data.get('body') in ['[deleted]', '[removed]']:
+                    if content in ['[deleted]', '[removed]']:
                         continue
-                        
-                    post = RedditPost(
-                        title='',
-                        content=item_data.get('body', ''),
-                        subreddit=item_data.get('subreddit', ''),
-                        score=item_data.get('score', 0),
-                        created_utc=item_data.get('created_utc', 0),
-                        url=f"https://reddit.com{item_data.get('permalink', '')}",
-                        post_type='comment'
-                    )
                 
                 # Only add if there's actual content
-                if post.content.strip() or post.title.strip():
-                    posts.append(post)
+                if not (content.strip() or title.strip()):
+                    continue
+                
+                scraped += 1
+                yield RedditPost(
+                    title=title,
+                    content=content,
+                    subreddit=item_data.get('subreddit', ''),
+                    score=item_data.get('score', 0),
+                    created_utc=item_data.get('created_utc', 0),
+                    url=f"https://reddit.com{item_data.get('permalink', '')}",
+                    post_type=content_type
+                )
             
-            print(f"Successfully scraped {len(posts)} {content_type}s")
+            print(f"Successfully scraped {scraped} {content_type}s")
             
         except requests.exceptions.RequestException as e:
             print(f"Error fetching {content_type}s: {e}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"Error parsing JSON for {content_type}s: {e}")
         except Exception as e:
             print(f"Unexpected error fetching {content_type}s: {e}")
-        
-        return posts
+
+# Keyword tables for the rule-based analysis, in the order the extractors report them
+_INTEREST_KEYWORDS = {
+    'programming': ['code', 'python', 'javascript', 'programming', 'developer', 'software'],
+    'gaming': ['game', 'gaming', 'play', 'steam', 'xbox', 'playstation'],
+    'technology': ['tech', 'technology', 'computer', 'laptop', 'phone'],
+    'music': ['music', 'song', 'album', 'artist', 'band'],
+    'sports': ['football', 'basketball', 'soccer', 'baseball', 'sport'],
+    'movies': ['movie', 'film', 'cinema', 'watch', 'series'],
+    'cooking': ['cook', 'recipe', 'food', 'kitchen', 'meal'],
+    'travel': ['travel', 'trip', 'vacation', 'country', 'visit']
+}
+
+_LOCATIONS = ['usa', 'america', 'canada', 'uk', 'britain', 'australia', 'europe']
+
+_OCCUPATION_KEYWORDS = {
+    'student': ['student', 'college', 'university', 'school'],
+    'developer': ['developer', 'programmer', 'coding', 'software'],
+    'teacher': ['teacher', 'teaching', 'education'],
+    'healthcare': ['doctor', 'nurse', 'medical', 'healthcare']
+}
+
+_GOAL_KEYWORDS = {
+    'Learn new skills': ['learn', 'learning', 'study', 'education'],
+    'Career advancement': ['job', 'career', 'work', 'promotion'],
+    'Help others': ['help', 'helping', 'advice', 'support'],
+    'Entertainment': ['fun', 'entertainment', 'hobby', 'enjoy']
+}
+
+_FRUSTRATION_KEYWORDS = {
+    'Technical issues': ['bug', 'error', 'problem', 'issue', 'broken'],
+    'Time management': ['time', 'busy', 'schedule', 'deadline'],
+    'Learning curve': ['difficult', 'hard', 'struggle', 'confusing']
+}
+
+_POSITIVE_WORDS = ['good', 'great', 'awesome', 'love', 'like', 'amazing', 'excellent']
+_NEGATIVE_WORDS = ['bad', 'terrible', 'hate', 'dislike', 'awful', 'horrible']
+
+# One shared vocabulary for the keyword sweep: (keyword, category, label)
+_KEYWORDS = [
+    (keyword, category, label)
+    for category, table in (('interests', _INTEREST_KEYWORDS),
+                            ('occupations', _OCCUPATION_KEYWORDS),
+                            ('goals', _GOAL_KEYWORDS),
+                            ('frustrations', _FRUSTRATION_KEYWORDS))
+    for label, keywords in table.items()
+    for keyword in keywords
+] + [(location, 'locations', location) for location in _LOCATIONS]
+
+def _build_automaton():
+    """Compile _KEYWORDS into a pyahocorasick automaton of (category, label) matches"""
+    # Some keywords (e.g. 'software') count towards more than one category
+    matches_by_keyword = defaultdict(list)
+    for keyword, category, label in _KEYWORDS:
+        matches_by_keyword[keyword].append((category, label))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, matches in matches_by_keyword.items():
+        automaton.add_word(keyword, matches)
+    automaton.make_automaton()
+    return automaton
+
+# Compile the vocabulary once at import so a single pass over the corpus finds every
+# keyword, preferring the compiled sweep, then pyahocorasick, then plain byte scans
+_SWEEPER = None
+_AUTOMATON = None
+if _persona_fast is not None:
+    _SWEEPER = _persona_fast.KeywordSweeper([keyword for keyword, _, _ in _KEYWORDS])
+elif ahocorasick is not None:
+    _AUTOMATON = _build_automaton()
+
+_KEYWORD_BYTES = [(keyword.encode('utf-8'), category, label) for keyword, category, label in _KEYWORDS]
+
+# Whole-word sentiment matchers over the bytes corpus
+_POSITIVE_RE = re.compile(rb'\b(?:' + '|'.join(_POSITIVE_WORDS).encode() + rb')\b', re.I)
+_NEGATIVE_RE = re.compile(rb'\b(?:' + '|'.join(_NEGATIVE_WORDS).encode() + rb')\b', re.I)
+
+def _scan_keywords(corpus: bytes) -> Dict[str, Set[str]]:
+    """Find which keyword labels occur in the UTF-8 corpus, grouped by category"""
+    hits = defaultdict(set)
+    
+    if _SWEEPER is not None:
+        for index in _SWEEPER.sweep(corpus):
+            _, category, label = _KEYWORDS[index]
+            hits[category].add(label)
+    elif _AUTOMATON is not None:
+        # pyahocorasick only matches str; latin-1 maps each byte to one character
+        # without validation, and multi-byte sequences can never match ASCII keywords
+        for _, matches in _AUTOMATON.iter(corpus.decode('latin-1')):
+            for category, label in matches:
+                hits[category].add(label)
+    else:
+        for keyword, category, label in _KEYWORD_BYTES:
+            if keyword in corpus:
+                hits[category].add(label)
+    
+    return hits
 
 class SimplePersonaAnalyzer:
     """Simple persona analyzer that doesn't require OpenAI"""
     
-    def analyze_user_persona(self, username: str, posts: List[RedditPost]) -> Dict:
+    def analyze_user_persona(self, username: str, posts: PostBatch) -> Dict:
         """Generate user persona from Reddit posts using simple analysis"""
         
         if not posts:
             return self._create_empty_persona(username)
         
-        # Analyze content
-        subreddits = [post.subreddit for post in posts if post.subreddit]
-        subreddit_counts = {}
-        for sub in subreddits:
-            subreddit_counts[sub] = subreddit_counts.get(sub, 0) + 1
-        
-        # Get top subreddits
-        top_subreddits = sorted(subreddit_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        # Analyze content themes
-        all_content = []
-        for post in posts:
-            if post.title:
-                all_content.append(post.title.lower())
-            if post.content:
-                all_content.append(post.content.lower())
-        
-        combined_text = ' '.join(all_content)
+        agg = self._aggregate(posts)
         
         # Simple keyword analysis
-        interests = self._extract_interests(combined_text, top_subreddits)
-        personality_traits = self._extract_personality_traits(posts)
-        behavior_patterns = self._extract_behavior_patterns(posts, subreddit_counts)
+        keyword_hits = _scan_keywords(agg.corpus)
+        interests = self._extract_interests(keyword_hits, agg)
+        personality_traits = self._extract_personality_traits(agg)
+        behavior_patterns = self._extract_behavior_patterns(agg)
         
         return {
             'username': username,
-            'demographics': self._infer_demographics(combined_text, top_subreddits),
+            'demographics': self._infer_demographics(keyword_hits),
             'interests': interests,
             'personality_traits': personality_traits,
             'behavior_patterns': behavior_patterns,
-            'goals_motivations': self._extract_goals(combined_text),
-            'frustrations': self._extract_frustrations(combined_text),
-            'online_habits': self._extract_online_habits(posts, subreddit_counts),
-            'citations': self._create_citations(posts)
+            'goals_motivations': self._extract_goals(keyword_hits),
+            'frustrations': self._extract_frustrations(keyword_hits),
+            'online_habits': self._extract_online_habits(agg),
+            'citations': self._create_citations(agg)
         }
     
-    def _extract_interests(self, text: str, top_subreddits: List) -> List[str]:
-        """Extract interests from text and subreddits"""
+    def _aggregate(self, posts: PostBatch) -> Aggregates:
+        """Compute every statistic the extractors need, one sweep per column"""
+        subreddit_counts = Counter(filter(None, posts.subreddits))
+        
+        # Keep the corpus as UTF-8 bytes: half the size of str for mostly-ASCII text,
+        # and every keyword is ASCII so byte-level matching finds the same hits
+        all_content = []
+        for title, content in zip(posts.titles, posts.contents):
+            if title:
+                all_content.append(title.encode('utf-8'))
+            if content:
+                all_content.append(content.encode('utf-8'))
+        
+        # Sample citations for top posts
+        top_posts = heapq.nlargest(5, range(len(posts)), key=posts.scores.__getitem__)
+        
+        return Aggregates(
+            post_count=len(posts),
+            total_posts=posts.post_types.count('post'),
+            total_comments=posts.post_types.count('comment'),
+            score_sum=sum(posts.scores),
+            subreddit_counts=subreddit_counts,
+            top_subreddits=subreddit_counts.most_common(10),
+            top_post_urls=[posts.urls[i] for i in top_posts if posts.urls[i]],
+            # Lowercase the joined corpus once rather than every title and body separately
+            corpus=b' '.join(all_content).lower()
+        )
+    
+    def _extract_interests(self, keyword_hits: Dict[str, Set[str]], agg: Aggregates) -> List[str]:
+        """Extract interests from keyword hits and subreddits"""
         interests = []
         
         # Add top subreddits as interests
-        for sub, count in top_subreddits[:5]:
+        for sub, count in agg.top_subreddits[:5]:
             interests.append(f"r/{sub} community")
         
         # Simple keyword matching
-        interest_keywords = {
-            'programming': ['code', 'python', 'javascript', 'programming', 'developer', 'software'],
-            'gaming': ['game', 'gaming', 'play', 'steam', 'xbox', 'playstation'],
-            'technology': ['tech', 'technology', 'computer', 'laptop', 'phone'],
-            'music': ['music', 'song', 'album', 'artist', 'band'],
-            'sports': ['football', 'basketball', 'soccer', 'baseball', 'sport'],
-            'movies': ['movie', 'film', 'cinema', 'watch', 'series'],
-            'cooking': ['cook', 'recipe', 'food', 'kitchen', 'meal'],
-            'travel': ['travel', 'trip', 'vacation', 'country', 'visit']
-        }
-        
-        for interest, keywords in interest_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for interest in _INTEREST_KEYWORDS:
+            if interest in keyword_hits['interests']:
                 interests.append(interest.title())
         
         return interests[:10]
     
-    def _extract_personality_traits(self, posts: List[RedditPost]) -> List[str]:
-        """Extract personality traits from posts"""
+    def _extract_personality_traits(self, agg: Aggregates) -> List[str]:
+        """Extract personality traits from posting counts and the lowercased corpus"""
         traits = []
         
         # Analyze posting patterns
-        total_posts = len([p for p in posts if p.post_type == 'post'])
-        total_comments = len([p for p in posts if p.post_type == 'comment'])
-        
-        if total_comments > total_posts:
+        if agg.total_comments > agg.total_posts:
             traits.append("More of a commenter than poster")
-        if total_posts > total_comments:
+        if agg.total_posts > agg.total_comments:
             traits.append("Active content creator")
         
         # Simple sentiment analysis
-        positive_words = ['good', 'great', 'awesome', 'love', 'like', 'amazing', 'excellent']
-        negative_words = ['bad', 'terrible', 'hate', 'dislike', 'awful', 'horrible']
-        
-        all_content = ' '.join([post.content.lower() for post in posts if post.content])
-        
-        positive_count = sum(1 for word in positive_words if word in all_content)
-        negative_count = sum(1 for word in negative_words if word in all_content)
+        positive_count = len(_POSITIVE_RE.findall(agg.corpus))
+        negative_count = len(_NEGATIVE_RE.findall(agg.corpus))
         
         if positive_count > negative_count * 1.5:
             traits.append("Generally positive attitude")
@@ -242,19 +456,19 @@ class SimplePersonaAnalyzer:
         
         return traits
     
-    def _extract_behavior_patterns(self, posts: List[RedditPost], subreddit_counts: Dict) -> List[str]:
+    def _extract_behavior_patterns(self, agg: Aggregates) -> List[str]:
         """Extract behavior patterns"""
         patterns = []
         
-        patterns.append(f"Active in {len(subreddit_counts)} different subreddits")
+        patterns.append(f"Active in {len(agg.subreddit_counts)} different subreddits")
         
-        avg_score = sum(post.score for post in posts) / len(posts) if posts else 0
+        avg_score = agg.score_sum / agg.post_count if agg.post_count else 0
         if avg_score > 10:
             patterns.append("Posts tend to receive good engagement")
         
         return patterns
     
-    def _infer_demographics(self, text: str, top_subreddits: List) -> Dict[str, str]:
+    def _infer_demographics(self, keyword_hits: Dict[str, Set[str]]) -> Dict[str, str]:
         """Infer basic demographics"""
         demographics = {
             'age_range': 'Unknown',
@@ -263,80 +477,56 @@ class SimplePersonaAnalyzer:
         }
         
         # Simple location inference
-        locations = ['usa', 'america', 'canada', 'uk', 'britain', 'australia', 'europe']
-        for location in locations:
-            if location in text:
+        for location in _LOCATIONS:
+            if location in keyword_hits['locations']:
                 demographics['location'] = location.title()
                 break
         
         # Simple occupation inference
-        occupations = {
-            'student': ['student', 'college', 'university', 'school'],
-            'developer': ['developer', 'programmer', 'coding', 'software'],
-            'teacher': ['teacher', 'teaching', 'education'],
-            'healthcare': ['doctor', 'nurse', 'medical', 'healthcare']
-        }
-        
-        for job, keywords in occupations.items():
-            if any(keyword in text for keyword in keywords):
+        for job in _OCCUPATION_KEYWORDS:
+            if job in keyword_hits['occupations']:
                 demographics['occupation'] = job.title()
                 break
         
         return demographics
     
-    def _extract_goals(self, text: str) -> List[str]:
+    def _extract_goals(self, keyword_hits: Dict[str, Set[str]]) -> List[str]:
         """Extract goals and motivations"""
         goals = []
         
-        goal_keywords = {
-            'Learn new skills': ['learn', 'learning', 'study', 'education'],
-            'Career advancement': ['job', 'career', 'work', 'promotion'],
-            'Help others': ['help', 'helping', 'advice', 'support'],
-            'Entertainment': ['fun', 'entertainment', 'hobby', 'enjoy']
-        }
-        
-        for goal, keywords in goal_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for goal in _GOAL_KEYWORDS:
+            if goal in keyword_hits['goals']:
                 goals.append(goal)
         
         return goals
     
-    def _extract_frustrations(self, text: str) -> List[str]:
+    def _extract_frustrations(self, keyword_hits: Dict[str, Set[str]]) -> List[str]:
         """Extract frustrations"""
         frustrations = []
         
-        frustration_keywords = {
-            'Technical issues': ['bug', 'error', 'problem', 'issue', 'broken'],
-            'Time management': ['time', 'busy', 'schedule', 'deadline'],
-            'Learning curve': ['difficult', 'hard', 'struggle', 'confusing']
-        }
-        
-        for frustration, keywords in frustration_keywords.items():
-            if any(keyword in text for keyword in keywords):
+        for frustration in _FRUSTRATION_KEYWORDS:
+            if frustration in keyword_hits['frustrations']:
                 frustrations.append(frustration)
         
         return frustrations
     
-    def _extract_online_habits(self, posts: List[RedditPost], subreddit_counts: Dict) -> List[str]:
+    def _extract_online_habits(self, agg: Aggregates) -> List[str]:
         """Extract online habits"""
         habits = []
         
-        if subreddit_counts:
-            top_sub = max(subreddit_counts, key=subreddit_counts.get)
+        if agg.top_subreddits:
+            top_sub = agg.top_subreddits[0][0]
             habits.append(f"Most active in r/{top_sub}")
         
-        habits.append(f"Has made {len(posts)} posts/comments")
+        habits.append(f"Has made {agg.post_count} posts/comments")
         
         return habits
     
-    def _create_citations(self, posts: List[RedditPost]) -> Dict[str, List[str]]:
+    def _create_citations(self, agg: Aggregates) -> Dict[str, List[str]]:
         """Create citations for persona characteristics"""
         citations = {}
         
-        # Sample citations for top posts
-        top_posts = sorted(posts, key=lambda x: x.score, reverse=True)[:5]
-        
-        citations['top_content'] = [post.url for post in top_posts if post.url]
+        citations['top_content'] = agg.top_post_urls
         
         return citations
     
@@ -354,107 +544,110 @@ class SimplePersonaAnalyzer:
             'citations': {}
         }
 
+# Sections written as bullet lists, in output order
+_BULLET_SECTIONS = [
+    ("INTERESTS", 'interests'),
+    ("PERSONALITY TRAITS", 'personality_traits'),
+    ("BEHAVIOR PATTERNS", 'behavior_patterns'),
+    ("GOALS & MOTIVATIONS", 'goals_motivations'),
+    ("FRUSTRATIONS", 'frustrations'),
+    ("ONLINE HABITS", 'online_habits')
+]
+
+_SECTION_RULE = "-" * 20 + "\n"
+
 def save_persona_to_file(persona: Dict, filename: str):
     """Save persona to text file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"USER PERSONA: {persona['username'].upper()}\n")
-        f.write("=" * 50 + "\n\n")
-        
-        # Demographics
-        f.write("DEMOGRAPHICS:\n")
-        f.write("-" * 20 + "\n")
-        for key, value in persona['demographics'].items():
-            f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-        f.write("\n")
-        
-        # Interests
-        f.write("INTERESTS:\n")
-        f.write("-" * 20 + "\n")
-        for interest in persona['interests']:
-            f.write(f"• {interest}\n")
-        f.write("\n")
-        
-        # Personality Traits
-        f.write("PERSONALITY TRAITS:\n")
-        f.write("-" * 20 + "\n")
-        for trait in persona['personality_traits']:
-            f.write(f"• {trait}\n")
-        f.write("\n")
-        
-        # Behavior Patterns
-        f.write("BEHAVIOR PATTERNS:\n")
-        f.write("-" * 20 + "\n")
-        for pattern in persona['behavior_patterns']:
-            f.write(f"• {pattern}\n")
-        f.write("\n")
-        
-        # Goals & Motivations
-        f.write("GOALS & MOTIVATIONS:\n")
-        f.write("-" * 20 + "\n")
-        for goal in persona['goals_motivations']:
-            f.write(f"• {goal}\n")
-        f.write("\n")
-        
-        # Frustrations
-        f.write("FRUSTRATIONS:\n")
-        f.write("-" * 20 + "\n")
-        for frustration in persona['frustrations']:
-            f.write(f"• {frustration}\n")
-        f.write("\n")
-        
-        # Online Habits
-        f.write("ONLINE HABITS:\n")
-        f.write("-" * 20 + "\n")
-        for habit in persona['online_habits']:
-            f.write(f"• {habit}\n")
-        f.write("\n")
-        
-        # Citations
-        if persona['citations']:
-            f.write("CITATIONS:\n")
-            f.write("-" * 20 + "\n")
-            for category, citations in persona['citations'].items():
-                if citations:
-                    f.write(f"{category.replace('_', ' ').title()}:\n")
-                    for citation in citations:
-                        f.write(f"  - {citation}\n")
-                    f.write("\n")
+    # Build the whole report in memory so it goes out in a single write
+    out = []
+    out.append(f"USER PERSONA: {persona['username'].upper()}\n")
+    out.append("=" * 50 + "\n\n")
+    
+    # Demographics
+    out.append("DEMOGRAPHICS:\n")
+    out.append(_SECTION_RULE)
+    for key, value in persona['demographics'].items():
+        out.append(f"{key.replace('_', ' ').title()}: {value}\n")
+    out.append("\n")
+    
+    # Interests, traits, patterns, goals, frustrations and habits
+    for heading, key in _BULLET_SECTIONS:
+        out.append(f"{heading}:\n")
+        out.append(_SECTION_RULE)
+        for item in persona[key]:
+            out.append(f"• {item}\n")
+        out.append("\n")
+    
+    # Citations
+    if persona['citations']:
+        out.append("CITATIONS:\n")
+        out.append(_SECTION_RULE)
+        for category, citations in persona['citations'].items():
+            if citations:
+                out.append(f"{category.replace('_', ' ').title()}:\n")
+                for citation in citations:
+                    out.append(f"  - {citation}\n")
+                out.append("\n")
+    
+    # Write to a temporary file and swap it in, so an interrupted run never
+    # leaves a truncated persona behind; mkstemp gives concurrent runs distinct temp files
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(''.join(out))
+        
+        # mkstemp creates the file as 0600; give it the permissions open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_filename, 0o666 & ~umask)
+        
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
 
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Generate Reddit user persona with citations')
-    parser.add_argument('profile_url', help='Reddit user profile URL')
-    parser.add_argument('-o', '--output', help='Output filename (optional)')
+    parser.add_argument('profile_urls', nargs='+', metavar='profile_url', help='Reddit user profile URL(s)')
+    parser.add_argument('-o', '--output', help='Output filename (optional, single profile only)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Cache Reddit responses on disk for {CACHE_EXPIRE_SECONDS // 60} minutes')
     
     args = parser.parse_args()
     
+    if args.output and len(args.profile_urls) > 1:
+        parser.error('--output can only be used with a single profile URL')
+    
     try:
         # Initialize scraper and analyzer
-        scraper = RedditScraper()
+        scraper = RedditScraper(use_cache=args.cache)
         analyzer = SimplePersonaAnalyzer()
         
-        # Extract username from URL
-        username = scraper.extract_username(args.profile_url)
-        print(f"Analyzing user: {username}")
-        
-        # Scrape user content
-        posts = scraper.scrape_user_content(username)
-        
-        if not posts:
-            print("Error: No content found - cannot generate persona")
-            return
-        
-        print(f"Found {len(posts)} posts/comments")
+        # Extract usernames from URLs
+        usernames = [scraper.extract_username(url) for url in args.profile_urls]
+        print(f"Analyzing user(s): {', '.join(usernames)}")
         
-        # Generate persona
-        print("Generating persona...")
-        persona = analyzer.analyze_user_persona(username, posts)
+        # Scrape all users' content concurrently
+        all_posts = scraper.scrape_many_users(usernames)
         
-        # Save to file
-        output_filename = args.output if args.output else f"{username}_persona.txt"
-        save_persona_to_file(persona, output_filename)
-        
-        print(f"Analysis complete! Check the file: {output_filename}")
+        for username, posts in zip(usernames, all_posts):
+            if not posts:
+                print(f"Error: No content found for {username} - cannot generate persona")
+                continue
+            
+            print(f"Found {len(posts)} posts/comments for {username}")
+            
+            # Generate persona
+            print(f"Generating persona for {username}...")
+            persona = analyzer.analyze_user_persona(username, posts)
+            
+            # Save to file
+            output_filename = args.output if args.output else f"{username}_persona.txt"
+            save_persona_to_file(persona, output_filename)
+            
+            print(f"Analysis complete! Check the file: {output_filename}")
         
     except Exception as e:
         print(f"Error: {e}")